@@ -2,19 +2,209 @@
 MCP component for MCP server integration
 """
 
+import json
 import os
 import platform
 import shlex
+import shutil
 import subprocess
 import sys
+import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 from setup import __version__
 
 from ..core.base import Component
+from ..utils.logger import Logger
+from ..utils.paths import get_home_directory
 from ..utils.ui import display_info, display_warning
 
+# Map common server name variations to our standard names
+_SERVER_NAME_MAPPINGS = MappingProxyType({
+    "context7": "context7",
+    "sequential-thinking": "sequential-thinking",
+    "sequential": "sequential-thinking",
+    "magic": "magic",
+    "playwright": "playwright",
+    "serena": "serena",
+    "morphllm": "morphllm-fast-apply",
+    "morphllm-fast-apply": "morphllm-fast-apply",
+    "morph": "morphllm-fast-apply",
+    "tavily": "tavily"
+})
+
+# Cached 'claude mcp list' result, reused across runs while ~/.claude.json,
+# the working directory and its .mcp.json are unchanged
+MCP_LIST_CACHE_FILE = ".mcp_cache.json"
+
+# Servers installed by running an install_command before registration:
+# install_method -> (required tool, source label for messages, install timeout)
+_COMMAND_INSTALL_METHODS = MappingProxyType({
+    "uv": ("uv", "using uv", 900),            # 15 minutes
+    "github": ("uvx", "from GitHub", 300),    # 5 minutes for GitHub clone and build
+})
+
+
+# Install commands are retried with exponential backoff, but only when the
+# failure looks like a transient network problem
+_INSTALL_ATTEMPTS = 3
+_TRANSIENT_ERROR_MARKERS = (
+    "etimedout", "econnreset", "econnrefused", "eai_again",
+    "timed out", "connection reset", "temporarily unavailable",
+    "could not resolve host", "network is unreachable",
+    "502 bad gateway", "503 service unavailable", "504 gateway",
+)
+
+
+def _is_transient_failure(stderr: Optional[str]) -> bool:
+    """Check whether failed command output points to a retryable network error"""
+    if not stderr:
+        return False
+    stderr = stderr.lower()
+    return any(marker in stderr for marker in _TRANSIENT_ERROR_MARKERS)
+
+
+def _parse_mcp_list_output(output: str) -> Set[str]:
+    """
+    Extract registered server names from 'claude mcp list' output
+
+    Each entry is printed as "<name>: <command> - <status>"; header and
+    "No MCP servers configured" lines have no colon and are skipped.
+    """
+    names = set()
+    for line in output.splitlines():
+        name, sep, _ = line.partition(':')
+        if sep:
+            names.add(name.strip().lower())
+    return names
+
+
+def _freeze_server_table(servers: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Pre-tokenize server commands and make the table read-only"""
+    table = {}
+    for server_name, server_info in servers.items():
+        server_info = dict(server_info)
+        if "install_command" in server_info:
+            server_info["install_argv"] = tuple(shlex.split(server_info["install_command"]))
+        if "run_command" in server_info:
+            server_info["run_argv"] = tuple(shlex.split(server_info["run_command"]))
+        table[server_name] = MappingProxyType(server_info)
+    return MappingProxyType(table)
+
+
+# MCP servers to install
+_MCP_SERVERS = _freeze_server_table({
+    "sequential-thinking": {
+        "name": "sequential-thinking",
+        "description": "Multi-step problem solving and systematic analysis",
+        "npm_package": "@modelcontextprotocol/server-sequential-thinking",
+        "required": True
+    },
+    "context7": {
+        "name": "context7", 
+        "description": "Official library documentation and code examples",
+        "npm_package": "@upstash/context7-mcp",
+        "required": True
+    },
+    "magic": {
+        "name": "magic",
+        "description": "Modern UI component generation and design systems",
+        "npm_package": "@21st-dev/magic",
+        "required": False,
+        "api_key_env": "TWENTYFIRST_API_KEY",
+        "api_key_description": "21st.dev API key for UI component generation"
+    },
+    "playwright": {
+        "name": "playwright",
+        "description": "Cross-browser E2E testing and automation",
+        "npm_package": "@playwright/mcp@latest",
+        "required": False
+    },
+    "serena": {
+        "name": "serena",
+        "description": "Semantic code analysis and intelligent editing",
+        "install_method": "github",
+        "install_command": "uvx --from git+https://github.com/oraios/serena serena --help",
+        "run_command": "uvx --from git+https://github.com/oraios/serena serena start-mcp-server --context ide-assistant",
+        "required": False
+    },
+    "morphllm-fast-apply": {
+        "name": "morphllm-fast-apply",
+        "description": "Fast Apply capability for context-aware code modifications",
+        "npm_package": "@morph-llm/morph-fast-apply",
+        "required": False,
+        "api_key_env": "MORPH_API_KEY",
+        "api_key_description": "Morph API key for Fast Apply"
+    },
+    "tavily": {
+        "name": "tavily",
+        "description": "Web search and real-time information retrieval for deep research",
+        "install_method": "npm",
+        "install_command": "npx -y tavily-mcp@0.1.2",
+        "required": False,
+        "api_key_env": "TAVILY_API_KEY",
+        "api_key_description": "Tavily API key for web search (get from https://app.tavily.com)"
+    }
+})
+_MCP_SERVER_KEYS = frozenset(_MCP_SERVERS)
+
+_METADATA = MappingProxyType({
+    "name": "mcp",
+    "version": __version__,
+    "description": "MCP server integration (Context7, Sequential, Magic, Playwright)",
+    "category": "integration"
+})
+
+
+class _SerializedLogger(Logger):
+    """
+    Wrapper around the shared project Logger for concurrent install workers
+
+    Logger keeps unsynchronized state (its per-level counters), so every
+    call from this component goes through one lock.
+    """
+
+    def __init__(self, logger: Logger):
+        # Wraps an existing Logger - its handlers must not be set up again
+        self._wrapped = logger
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined here (e.g. log_counts)
+        if name == "_wrapped":
+            raise AttributeError(name)
+        return getattr(self._wrapped, name)
+
+    def debug(self, message: str, **kwargs: Any) -> None:
+        with self._lock:
+            self._wrapped.debug(message, **kwargs)
+
+    def info(self, message: str, **kwargs: Any) -> None:
+        with self._lock:
+            self._wrapped.info(message, **kwargs)
+
+    def warning(self, message: str, **kwargs: Any) -> None:
+        with self._lock:
+            self._wrapped.warning(message, **kwargs)
+
+    def error(self, message: str, **kwargs: Any) -> None:
+        with self._lock:
+            self._wrapped.error(message, **kwargs)
+
+    def success(self, message: str, **kwargs: Any) -> None:
+        with self._lock:
+            self._wrapped.success(message, **kwargs)
+
+    def exception(self, message: str, exc_info: bool = True, **kwargs: Any) -> None:
+        with self._lock:
+            self._wrapped.exception(message, exc_info=exc_info, **kwargs)
+
 
 class MCPComponent(Component):
     """MCP servers integration component"""
@@ -22,76 +212,41 @@ class MCPComponent(Component):
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
+        # Install workers log concurrently through the shared project Logger
+        self.logger = _SerializedLogger(self.logger)
         self.installed_servers_in_session: List[str] = []
+        # Servers are installed concurrently, but 'claude mcp add' rewrites
+        # the Claude config file and must not run in parallel
+        self._registry_lock = threading.Lock()
+        self._installed_cache: Optional[Set[str]] = None
+        self._installed_listing: Optional[str] = None
+        self._installed_cache_lock = threading.RLock()
+        self._tool_versions: Dict[str, Tuple[bool, str]] = {}
+        self._executables: Dict[str, Optional[str]] = {}
+        self._config_detection: Optional[Tuple[Tuple[Path, float], List[str]]] = None
         
-        # Define MCP servers to install
-        self.mcp_servers = {
-            "sequential-thinking": {
-                "name": "sequential-thinking",
-                "description": "Multi-step problem solving and systematic analysis",
-                "npm_package": "@modelcontextprotocol/server-sequential-thinking",
-                "required": True
-            },
-            "context7": {
-                "name": "context7", 
-                "description": "Official library documentation and code examples",
-                "npm_package": "@upstash/context7-mcp",
-                "required": True
-            },
-            "magic": {
-                "name": "magic",
-                "description": "Modern UI component generation and design systems",
-                "npm_package": "@21st-dev/magic",
-                "required": False,
-                "api_key_env": "TWENTYFIRST_API_KEY",
-                "api_key_description": "21st.dev API key for UI component generation"
-            },
-            "playwright": {
-                "name": "playwright",
-                "description": "Cross-browser E2E testing and automation",
-                "npm_package": "@playwright/mcp@latest",
-                "required": False
-            },
-            "serena": {
-                "name": "serena",
-                "description": "Semantic code analysis and intelligent editing",
-                "install_method": "github",
-                "install_command": "uvx --from git+https://github.com/oraios/serena serena --help",
-                "run_command": "uvx --from git+https://github.com/oraios/serena serena start-mcp-server --context ide-assistant",
-                "required": False
-            },
-            "morphllm-fast-apply": {
-                "name": "morphllm-fast-apply",
-                "description": "Fast Apply capability for context-aware code modifications",
-                "npm_package": "@morph-llm/morph-fast-apply",
-                "required": False,
-                "api_key_env": "MORPH_API_KEY",
-                "api_key_description": "Morph API key for Fast Apply"
-            },
-            "tavily": {
-                "name": "tavily",
-                "description": "Web search and real-time information retrieval for deep research",
-                "install_method": "npm",
-                "install_command": "npx -y tavily-mcp@0.1.2",
-                "required": False,
-                "api_key_env": "TAVILY_API_KEY",
-                "api_key_description": "Tavily API key for web search (get from https://app.tavily.com)"
-            }
-        }
+        self.mcp_servers = _MCP_SERVERS
     
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
-        return {
-            "name": "mcp",
-            "version": __version__,
-            "description": "MCP server integration (Context7, Sequential, Magic, Playwright)",
-            "category": "integration"
-        }
+        return dict(_METADATA)
 
     def is_reinstallable(self) -> bool:
         """This component manages sub-components (servers) and should be re-run."""
         return True
 
+    def _resolve_executable(self, name: str) -> Optional[str]:
+        """Resolve an executable on PATH, caching the result"""
+        if name not in self._executables:
+            executable = shutil.which(name)
+            if not executable and name == "claude":
+                # A local Claude CLI install lives in ~/.claude/local and is
+                # only reachable through a shell alias; exec it directly
+                # instead of starting an interactive shell for every call
+                executable = shutil.which(str(Path.home() / ".claude" / "local" / "claude"))
+            self._executables[name] = executable
+        return self._executables[name]
+
     def _run_command_cross_platform(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
         """
         Run a command with proper cross-platform shell handling.
@@ -106,92 +261,94 @@ class MCPComponent(Component):
         if platform.system() == "Windows":
             # Windows: Use list format with shell=True
             return subprocess.run(cmd, shell=True, **kwargs)
-        else:
-            # macOS/Linux: Use string format with proper shell to support aliases
-            cmd_str = " ".join(shlex.quote(str(arg)) for arg in cmd)
 
-            # Use the user's shell with interactive mode to load aliases
-            user_shell = os.environ.get('SHELL', '/bin/bash')
+        # macOS/Linux: Execute binaries found on PATH directly, without
+        # paying for an interactive shell startup on every call
+        executable = self._resolve_executable(str(cmd[0]))
+        if executable:
+            return subprocess.run([executable] + [str(arg) for arg in cmd[1:]], **kwargs)
+
+        # Not on PATH - the command may be a shell alias, so fall back to the
+        # user's interactive shell
+        cmd_str = shlex.join(str(arg) for arg in cmd)
+        user_shell = os.environ.get('SHELL', '/bin/bash')
+        full_cmd = f"{user_shell} -i -c {shlex.quote(cmd_str)}"
+        return subprocess.run(full_cmd, shell=True, **kwargs)
+
+    def _probe_tool(self, tool: str) -> Tuple[bool, str]:
+        """
+        Check whether a command line tool is available
+
+        Results are cached per component instance so each tool is probed at
+        most once per session.
+
+        Args:
+            tool: Executable name (e.g. "node", "uv")
+
+        Returns:
+            Tuple of (available: bool, version: str)
+        """
+        if tool not in self._tool_versions:
+            try:
+                result = self._run_command_cross_platform(
+                    [tool, "--version"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    timeout=10
+                )
+                available = result.returncode == 0
+                version = result.stdout.strip() if available else ""
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                available, version = False, ""
+            self._tool_versions[tool] = (available, version)
+
+        return self._tool_versions[tool]
 
-            # Execute command with user's shell in interactive mode to load aliases
-            full_cmd = f"{user_shell} -i -c {shlex.quote(cmd_str)}"
-            return subprocess.run(full_cmd, shell=True, env=os.environ, **kwargs)
-    
     def validate_prerequisites(self, installSubPath: Optional[Path] = None) -> Tuple[bool, List[str]]:
         """Check prerequisites"""
         errors = []
 
-        # Check if Node.js is available
-        try:
-            result = self._run_command_cross_platform(
-                ["node", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                errors.append("Node.js not found - required for MCP servers")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Node.js {version}")
+        # Probe all tools concurrently; results are cached for the checks below
+        tools = ["node", "claude", "npm", "uv"]
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            list(executor.map(self._probe_tool, tools))
 
-                # Check version (require 18+)
-                try:
-                    version_num = int(version.lstrip('v').split('.')[0])
-                    if version_num < 18:
-                        errors.append(f"Node.js version {version} found, but version 18+ required")
-                except:
-                    self.logger.warning(f"Could not parse Node.js version: {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Check if Node.js is available
+        node_ok, version = self._probe_tool("node")
+        if not node_ok:
             errors.append("Node.js not found - required for MCP servers")
+        else:
+            self.logger.debug(f"Found Node.js {version}")
+
+            # Check version (require 18+)
+            try:
+                version_num = int(version.lstrip('v').split('.')[0])
+                if version_num < 18:
+                    errors.append(f"Node.js version {version} found, but version 18+ required")
+            except:
+                self.logger.warning(f"Could not parse Node.js version: {version}")
 
         # Check if Claude CLI is available
-        try:
-            result = self._run_command_cross_platform(
-                ["claude", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                errors.append("Claude CLI not found - required for MCP server management")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Claude CLI {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        claude_ok, version = self._probe_tool("claude")
+        if not claude_ok:
             errors.append("Claude CLI not found - required for MCP server management")
+        else:
+            self.logger.debug(f"Found Claude CLI {version}")
 
         # Check if npm is available
-        try:
-            result = self._run_command_cross_platform(
-                ["npm", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                errors.append("npm not found - required for MCP server installation")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found npm {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        npm_ok, version = self._probe_tool("npm")
+        if not npm_ok:
             errors.append("npm not found - required for MCP server installation")
+        else:
+            self.logger.debug(f"Found npm {version}")
 
         # Check if uv is available (required for Serena)
-        try:
-            result = self._run_command_cross_platform(
-                ["uv", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                self.logger.warning("uv not found - required for Serena MCP server installation")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found uv {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        uv_ok, version = self._probe_tool("uv")
+        if not uv_ok:
             self.logger.warning("uv not found - required for Serena MCP server installation")
+        else:
+            self.logger.debug(f"Found uv {version}")
 
         return len(errors) == 0, errors
     
@@ -216,238 +373,276 @@ class MCPComponent(Component):
             }
         }
     
-    def _install_uv_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> bool:
-        """Install a single MCP server using uv"""
+    def _register_mcp_server(self, server_name: str, run_argv: Sequence[str]) -> subprocess.CompletedProcess:
+        """
+        Register an MCP server run command with Claude CLI (user scope)
+
+        Args:
+            server_name: Name to register the server under
+            run_argv: Command Claude should run to start the server
+
+        Returns:
+            CompletedProcess result of 'claude mcp add'
+        """
+        with self._registry_lock:
+            result = self._run_command_cross_platform(
+                ["claude", "mcp", "add", "-s", "user", "--", server_name, *run_argv],
+                stdout=subprocess.DEVNULL,  # only stderr is reported on failure
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=120  # 2 minutes timeout for registration
+            )
+
+        if result.returncode == 0:
+            self._set_server_installed(server_name, True)
+        return result
+
+    def _install_command_mcp_server(self, server_info: Mapping[str, Any], config: Dict[str, Any]) -> bool:
+        """Install a single MCP server by running its install_command, then register its run_command"""
         server_name = server_info["name"]
+        install_method = server_info["install_method"]
+        tool, source, timeout = _COMMAND_INSTALL_METHODS[install_method]
         install_command = server_info.get("install_command")
         run_command = server_info.get("run_command")
 
         if not install_command:
-            self.logger.error(f"No install_command found for uv-based server {server_name}")
+            self.logger.error(f"No install_command found for {install_method}-based server {server_name}")
             return False
         if not run_command:
-            self.logger.error(f"No run_command found for uv-based server {server_name}")
+            self.logger.error(f"No run_command found for {install_method}-based server {server_name}")
             return False
 
         try:
-            self.logger.info(f"Installing MCP server using uv: {server_name}")
+            self.logger.info(f"Installing MCP server {source}: {server_name}")
 
             if self._check_mcp_server_installed(server_name):
                 self.logger.info(f"MCP server {server_name} already installed")
                 return True
 
-            # Check if uv is available
-            try:
-                uv_check = self._run_command_cross_platform(
-                    ["uv", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if uv_check.returncode != 0:
-                    self.logger.error(f"uv not found - required for {server_name} installation")
-                    return False
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                self.logger.error(f"uv not found - required for {server_name} installation")
+            # Check if the installer tool is available
+            if not self._probe_tool(tool)[0]:
+                self.logger.error(f"{tool} not found - required for {server_name} installation")
                 return False
 
             if config.get("dry_run"):
-                self.logger.info(f"Would install MCP server (user scope): {install_command}")
+                self.logger.info(f"Would install MCP server {source}: {install_command}")
                 self.logger.info(f"Would register MCP server run command: {run_command}")
                 return True
 
-            # Run install command
+            # Install and registration stay separate processes rather than one
+            # "install && claude mcp add" shell chain: installs run in parallel
+            # while registration holds the registry lock, and each step reports
+            # its own error output
             self.logger.debug(f"Running: {install_command}")
-            cmd_parts = shlex.split(install_command)
-            result = self._run_command_cross_platform(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=900   # 15 minutes
-            )
-
-            if result.returncode == 0:
-                self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
-
-                # For Serena, we need to handle the run command specially
-                if server_name == "serena":
-                    # Serena needs project-specific registration, use current working directory
-                    current_dir = os.getcwd()
-                    serena_run_cmd = f"{run_command} --project {shlex.quote(current_dir)}"
-                    self.logger.info(f"Registering {server_name} with Claude CLI for project: {current_dir}")
-                    reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(serena_run_cmd)
-                else:
-                    self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {run_command}")
-                    reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(run_command)
-
-                reg_result = self._run_command_cross_platform(
-                    reg_cmd,
+            for attempt in range(_INSTALL_ATTEMPTS):
+                result = self._run_command_cross_platform(
+                    list(server_info["install_argv"]),
                     capture_output=True,
                     text=True,
-                    timeout=120
+                    timeout=timeout
                 )
+                if (result.returncode == 0 or attempt == _INSTALL_ATTEMPTS - 1
+                        or not _is_transient_failure(result.stderr)):
+                    break
 
-                if reg_result.returncode == 0:
-                    self.logger.success(f"Successfully registered {server_name} with Claude CLI.")
-                    return True
-                else:
-                    error_msg = reg_result.stderr.strip() if reg_result.stderr else "Unknown error"
-                    self.logger.error(f"Failed to register MCP server {server_name} with Claude CLI: {error_msg}")
-                    return False
-            else:
+                delay = 2 ** attempt
+                self.logger.warning(f"Network error installing MCP server {server_name}, retrying in {delay}s...")
+                time.sleep(delay)
+
+            if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                self.logger.error(f"Failed to install MCP server {server_name} using uv: {error_msg}\n{result.stdout}")
+                self.logger.error(f"Failed to install MCP server {server_name} {source}: {error_msg}\n{result.stdout}")
                 return False
 
+            self.logger.success(f"Successfully installed MCP server {source}: {server_name}")
+
+            run_argv = server_info["run_argv"]
+            if install_method == "uv" and server_name == "serena":
+                # Serena needs project-specific registration, use current working directory
+                current_dir = os.getcwd()
+                self.logger.info(f"Registering {server_name} with Claude CLI for project: {current_dir}")
+                run_argv = [*run_argv, "--project", current_dir]
+            else:
+                self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {run_command}")
+
+            reg_result = self._register_mcp_server(server_name, run_argv)
+            if reg_result.returncode == 0:
+                self.logger.success(f"Successfully registered {server_name} with Claude CLI.")
+                return True
+
+            error_msg = reg_result.stderr.strip() if reg_result.stderr else "Unknown error"
+            self.logger.error(f"Failed to register MCP server {server_name} with Claude CLI: {error_msg}")
+            return False
+
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Timeout installing MCP server {server_name} using uv")
+            self.logger.error(f"Timeout installing MCP server {server_name} {source}")
             return False
         except Exception as e:
-            self.logger.error(f"Error installing MCP server {server_name} using uv: {e}")
+            self.logger.error(f"Error installing MCP server {server_name} {source}: {e}")
             return False
-    
 
-    def _install_github_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> bool:
-        """Install a single MCP server from GitHub using uvx"""
-        server_name = server_info["name"]
-        install_command = server_info.get("install_command")
-        run_command = server_info.get("run_command")
-
-        if not install_command:
-            self.logger.error(f"No install_command found for GitHub-based server {server_name}")
-            return False
-        if not run_command:
-            self.logger.error(f"No run_command found for GitHub-based server {server_name}")
-            return False
+    def _get_installed_servers(self, force: bool = False) -> Optional[Set[str]]:
+        """
+        Get names of MCP servers registered with Claude CLI
 
-        try:
-            self.logger.info(f"Installing MCP server from GitHub: {server_name}")
+        The parsed 'claude mcp list' output is cached for the session and kept
+        up to date after successful add/remove operations. Only _install()
+        seeds this from the result saved by a previous run.
 
-            if self._check_mcp_server_installed(server_name):
-                self.logger.info(f"MCP server {server_name} already installed")
-                return True
+        Args:
+            force: Re-run 'claude mcp list' even if a cached result exists
 
-            # Check if uvx is available
-            try:
-                uvx_check = self._run_command_cross_platform(
-                    ["uvx", "--version"],
+        Returns:
+            Set of lowercased server names, or None if the CLI could not be queried
+        """
+        with self._installed_cache_lock:
+            if self._installed_cache is None or force:
+                result = self._run_command_cross_platform(
+                    ["claude", "mcp", "list"],
                     capture_output=True,
                     text=True,
-                    timeout=10
+                    timeout=60
                 )
-                if uvx_check.returncode != 0:
-                    self.logger.error(f"uvx not found - required for {server_name} installation")
-                    return False
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                self.logger.error(f"uvx not found - required for {server_name} installation")
-                return False
 
-            if config.get("dry_run"):
-                self.logger.info(f"Would install MCP server from GitHub: {install_command}")
-                self.logger.info(f"Would register MCP server run command: {run_command}")
-                return True
+                if result.returncode != 0:
+                    self.logger.warning(f"Could not list MCP servers: {result.stderr}")
+                    return None
 
-            # Run install command to test the GitHub installation
-            self.logger.debug(f"Testing GitHub installation: {install_command}")
-            cmd_parts = shlex.split(install_command)
-            result = self._run_command_cross_platform(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=300   # 5 minutes for GitHub clone and build
-            )
+                self._installed_listing = result.stdout
+                self._installed_cache = _parse_mcp_list_output(result.stdout)
+                self._save_installed_servers_cache()
 
-            if result.returncode == 0:
-                self.logger.success(f"Successfully tested GitHub MCP server: {server_name}")
+            return self._installed_cache
 
-                # Register with Claude CLI using the run command
-                self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {run_command}")
-                reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(run_command)
+    def _cli_config_key(self) -> Optional[List[Any]]:
+        """
+        Identify the inputs of 'claude mcp list' for the current directory
 
-                reg_result = self._run_command_cross_platform(
-                    reg_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
+        The listing includes local-scope servers stored per project in
+        ~/.claude.json and project-scope servers from ./.mcp.json, so the key
+        is [config path, config mtime, cwd, project config mtime or None].
+        """
+        config_file = get_home_directory() / ".claude.json"
+        try:
+            cwd = os.getcwd()
+            config_mtime = config_file.stat().st_mtime
+        except OSError:
+            return None
 
-                if reg_result.returncode == 0:
-                    self.logger.success(f"Successfully registered {server_name} with Claude CLI.")
-                    return True
-                else:
-                    error_msg = reg_result.stderr.strip() if reg_result.stderr else "Unknown error"
-                    self.logger.error(f"Failed to register MCP server {server_name} with Claude CLI: {error_msg}")
-                    return False
-            else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                self.logger.error(f"Failed to install MCP server {server_name} from GitHub: {error_msg}\n{result.stdout}")
-                return False
+        try:
+            project_mtime = os.stat(os.path.join(cwd, ".mcp.json")).st_mtime
+        except OSError:
+            project_mtime = None
 
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"Timeout installing MCP server {server_name} from GitHub")
-            return False
-        except Exception as e:
-            self.logger.error(f"Error installing MCP server {server_name} from GitHub: {e}")
-            return False
+        return [str(config_file), config_mtime, cwd, project_mtime]
+
+    def _load_installed_servers_cache(self) -> Optional[Set[str]]:
+        """Load the server list saved by a previous run if the Claude CLI config is unchanged"""
+        config_key = self._cli_config_key()
+        if config_key is None:
+            return None
+
+        try:
+            with open(self.install_dir / MCP_LIST_CACHE_FILE, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Anything that doesn't look like a file we wrote is a cache miss
+        if not isinstance(cached, dict) or cached.get("config") != config_key:
+            return None
+        servers = cached.get("servers")
+        if not isinstance(servers, list) or not all(isinstance(name, str) for name in servers):
+            return None
+
+        self.logger.debug("Using cached 'claude mcp list' result")
+        return set(servers)
+
+    def _save_installed_servers_cache(self) -> None:
+        """Persist the installed servers set, keyed by the current Claude CLI config state"""
+        with self._installed_cache_lock:
+            config_key = self._cli_config_key()
+            if config_key is None or self._installed_cache is None:
+                return
+
+            try:
+                with open(self.install_dir / MCP_LIST_CACHE_FILE, 'w') as f:
+                    json.dump({"config": config_key, "servers": sorted(self._installed_cache)}, f, indent=2)
+            except OSError as e:
+                self.logger.debug(f"Could not write MCP server cache: {e}")
+
+    def _set_server_installed(self, server_name: str, installed: bool) -> None:
+        """Record a successful add/remove in the installed servers cache"""
+        with self._installed_cache_lock:
+            if self._installed_cache is None:
+                return
+            if installed:
+                self._installed_cache.add(server_name.lower())
+            else:
+                self._installed_cache.discard(server_name.lower())
 
     def _check_mcp_server_installed(self, server_name: str) -> bool:
         """Check if MCP server is already installed"""
         try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode != 0:
-                self.logger.warning(f"Could not list MCP servers: {result.stderr}")
+            installed_servers = self._get_installed_servers()
+            if installed_servers is None:
                 return False
 
-            # Parse output to check if server is installed
-            output = result.stdout.lower()
-            return server_name.lower() in output
+            return server_name.lower() in installed_servers
 
         except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
             self.logger.warning(f"Error checking MCP server status: {e}")
             return False
 
+    def _find_claude_config(self) -> Optional[Tuple[Path, float]]:
+        """Find the Claude Desktop/CLI config file and its modification time"""
+        config_paths = [
+            self.install_dir / "claude_desktop_config.json",
+            Path.home() / ".claude" / "claude_desktop_config.json",
+            Path.home() / ".claude.json",  # Claude CLI config
+            Path.home() / "AppData" / "Roaming" / "Claude" / "claude_desktop_config.json",  # Windows
+            Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",  # macOS
+        ]
+
+        for path in config_paths:
+            try:
+                return path, path.stat().st_mtime
+            except OSError:
+                continue
+
+        return None
+
     def _detect_existing_mcp_servers_from_config(self) -> List[str]:
         """Detect existing MCP servers from Claude Desktop config"""
         detected_servers = []
 
         try:
             # Try to find Claude Desktop config file
-            config_paths = [
-                self.install_dir / "claude_desktop_config.json",
-                Path.home() / ".claude" / "claude_desktop_config.json",
-                Path.home() / ".claude.json",  # Claude CLI config
-                Path.home() / "AppData" / "Roaming" / "Claude" / "claude_desktop_config.json",  # Windows
-                Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",  # macOS
-            ]
-
-            config_file = None
-            for path in config_paths:
-                if path.exists():
-                    config_file = path
-                    break
-
-            if not config_file:
+            found = self._find_claude_config()
+            if not found:
                 self.logger.debug("No Claude Desktop config file found")
                 return detected_servers
 
-            import json
+            # Reuse the previous result while the config file is unchanged
+            if self._config_detection and self._config_detection[0] == found:
+                return list(self._config_detection[1])
+
+            config_file = found[0]
             with open(config_file, 'r') as f:
                 config = json.load(f)
 
-            # Extract MCP server names from mcpServers section
-            mcp_servers = config.get("mcpServers", {})
-            for server_name in mcp_servers.keys():
+            # Only the server names are needed - drop the rest of the config
+            server_names = list(config.get("mcpServers", {}))
+            del config
+
+            for server_name in server_names:
                 # Map common name variations to our standard names
                 normalized_name = self._normalize_server_name(server_name)
-                if normalized_name and normalized_name in self.mcp_servers:
+                if normalized_name and normalized_name in _MCP_SERVER_KEYS:
                     detected_servers.append(normalized_name)
 
+            self._config_detection = (found, list(detected_servers))
+
             if detected_servers:
                 self.logger.info(f"Detected existing MCP servers from config: {detected_servers}")
 
@@ -461,27 +656,14 @@ class MCPComponent(Component):
         detected_servers = []
 
         try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode != 0:
-                self.logger.debug(f"Could not list MCP servers: {result.stderr}")
+            installed_servers = self._get_installed_servers()
+            if installed_servers is None:
                 return detected_servers
 
-            # Parse the output to extract server names
-            output_lines = result.stdout.strip().split('\n')
-            for line in output_lines:
-                line = line.strip().lower()
-                if line and not line.startswith('#') and not line.startswith('no'):
-                    # Extract server name (usually the first word or before first space/colon)
-                    server_name = line.split()[0] if line.split() else ""
-                    normalized_name = self._normalize_server_name(server_name)
-                    if normalized_name and normalized_name in self.mcp_servers:
-                        detected_servers.append(normalized_name)
+            # Map registered names onto our standard names once, then report
+            # them in the order of our server table
+            normalized_names = {self._normalize_server_name(name) for name in installed_servers}
+            detected_servers = [name for name in self.mcp_servers if name in normalized_names]
 
             if detected_servers:
                 self.logger.info(f"Detected existing MCP servers from CLI: {detected_servers}")
@@ -496,34 +678,19 @@ class MCPComponent(Component):
         if not server_name:
             return None
 
-        server_name = server_name.lower().strip()
-
-        # Map common variations to our standard names
-        name_mappings = {
-            "context7": "context7",
-            "sequential-thinking": "sequential-thinking",
-            "sequential": "sequential-thinking",
-            "magic": "magic",
-            "playwright": "playwright",
-            "serena": "serena",
-            "morphllm": "morphllm-fast-apply",
-            "morphllm-fast-apply": "morphllm-fast-apply",
-            "morph": "morphllm-fast-apply"
-        }
-
-        return name_mappings.get(server_name)
+        # Names read back from the CLI are usually already normalized
+        normalized = _SERVER_NAME_MAPPINGS.get(server_name)
+        if normalized is not None:
+            return normalized
+        return _SERVER_NAME_MAPPINGS.get(server_name.strip().lower())
 
     def _merge_server_lists(self, existing_servers: List[str], selected_servers: List[str], previous_servers: List[str]) -> List[str]:
         """Merge existing, selected, and previously installed servers"""
-        all_servers = set()
-
-        # Add all detected servers
-        all_servers.update(existing_servers)
-        all_servers.update(selected_servers)
-        all_servers.update(previous_servers)
+        # De-duplicate while keeping first-seen order for deterministic output
+        all_servers = dict.fromkeys(chain(existing_servers, selected_servers, previous_servers))
 
         # Filter to only include servers we know how to install
-        valid_servers = [s for s in all_servers if s in self.mcp_servers]
+        valid_servers = [s for s in all_servers if s in _MCP_SERVER_KEYS]
 
         if valid_servers:
             self.logger.info(f"Total servers to manage: {valid_servers}")
@@ -536,12 +703,29 @@ class MCPComponent(Component):
 
         return valid_servers
     
-    def _install_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> bool:
+    def _show_api_key_notice(self, server_info: Mapping[str, Any], config: Dict[str, Any]) -> None:
+        """Tell the user about the API key a server needs, if any"""
+        if "api_key_env" not in server_info or config.get("dry_run", False):
+            return
+
+        server_name = server_info["name"]
+        api_key_env = server_info["api_key_env"]
+        api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
+
+        display_info(f"MCP server '{server_name}' requires an API key")
+        display_info(f"Environment variable: {api_key_env}")
+        display_info(f"Description: {api_key_desc}")
+
+        # Check if API key is already set
+        if not os.getenv(api_key_env):
+            display_warning(f"API key {api_key_env} not found in environment")
+            self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
+
+    def _install_mcp_server(self, server_info: Mapping[str, Any], config: Dict[str, Any],
+                            show_api_key_notice: bool = True) -> bool:
         """Install a single MCP server"""
-        if server_info.get("install_method") == "uv":
-            return self._install_uv_mcp_server(server_info, config)
-        elif server_info.get("install_method") == "github":
-            return self._install_github_mcp_server(server_info, config)
+        if server_info.get("install_method") in _COMMAND_INSTALL_METHODS:
+            return self._install_command_mcp_server(server_info, config)
 
         server_name = server_info["name"]
         npm_package = server_info.get("npm_package")
@@ -562,52 +746,24 @@ class MCPComponent(Component):
                 return True
             
             # Handle API key requirements
-            if "api_key_env" in server_info:
-                api_key_env = server_info["api_key_env"]
-                api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
-                
-                if not config.get("dry_run", False):
-                    display_info(f"MCP server '{server_name}' requires an API key")
-                    display_info(f"Environment variable: {api_key_env}")
-                    display_info(f"Description: {api_key_desc}")
-                    
-                    # Check if API key is already set
-                    import os
-                    if not os.getenv(api_key_env):
-                        display_warning(f"API key {api_key_env} not found in environment")
-                        self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
+            if show_api_key_notice:
+                self._show_api_key_notice(server_info, config)
             
             # Install using Claude CLI
             if install_command:
                 # Use the full install command (e.g., for tavily-mcp@0.1.2)
-                install_args = install_command.split()
-                if config.get("dry_run"):
-                    self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {' '.join(install_args)}")
-                    return True
-                
-                self.logger.debug(f"Running: claude mcp add -s user {server_name} {' '.join(install_args)}")
-                
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "add", "-s", "user", "--", server_name] + install_args,
-                    capture_output=True,
-                    text=True,
-                    timeout=120  # 2 minutes timeout for installation
-                )
+                run_argv = server_info["install_argv"]
             else:
-                # Use npm_package
-                if config.get("dry_run"):
-                    self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {command} -y {npm_package}")
-                    return True
-                
-                self.logger.debug(f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}")
-                
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
-                    capture_output=True,
-                    text=True,
-                    timeout=120  # 2 minutes timeout for installation
-                )
-            
+                run_argv = [command, "-y", npm_package]
+
+            if config.get("dry_run"):
+                self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {' '.join(run_argv)}")
+                return True
+
+            self.logger.debug(f"Running: claude mcp add -s user {server_name} {' '.join(run_argv)}")
+
+            result = self._register_mcp_server(server_name, run_argv)
+
             if result.returncode == 0:
                 self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
                 return True
@@ -635,14 +791,17 @@ class MCPComponent(Component):
             
             self.logger.debug(f"Running: claude mcp remove {server_name} (auto-detect scope)")
             
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "remove", server_name],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            with self._registry_lock:
+                result = self._run_command_cross_platform(
+                    ["claude", "mcp", "remove", server_name],
+                    stdout=subprocess.DEVNULL,  # only stderr is reported on failure
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=60
+                )
             
             if result.returncode == 0:
+                self._set_server_installed(server_name, False)
                 self.logger.success(f"Successfully uninstalled MCP server: {server_name}")
                 return True
             else:
@@ -668,11 +827,17 @@ class MCPComponent(Component):
                 self.logger.error(error)
             return False
 
+        # Reuse the server listing saved by a previous run while the Claude
+        # CLI config is unchanged
+        with self._installed_cache_lock:
+            if self._installed_cache is None:
+                self._installed_cache = self._load_installed_servers_cache()
+
         # Auto-detect existing servers
         self.logger.info("Auto-detecting existing MCP servers...")
         existing_from_config = self._detect_existing_mcp_servers_from_config()
         existing_from_cli = self._detect_existing_mcp_servers_from_cli()
-        existing_servers = list(set(existing_from_config + existing_from_cli))
+        existing_servers = list(dict.fromkeys(existing_from_config + existing_from_cli))
 
         # Get selected servers from config
         selected_servers = config.get("selected_mcp_servers", [])
@@ -690,34 +855,59 @@ class MCPComponent(Component):
 
         self.logger.info(f"Managing MCP servers: {', '.join(all_servers)}")
 
-        # Install/verify each server
         installed_count = 0
         failed_servers = []
         verified_servers = []
+        results: Dict[str, bool] = {}
 
+        # Servers that are already registered need no further work
+        pending_servers = []
         for server_name in all_servers:
-            if server_name in self.mcp_servers:
-                server_info = self.mcp_servers[server_name]
-
-                # Check if already installed and working
-                if self._check_mcp_server_installed(server_name):
-                    self.logger.info(f"MCP server {server_name} already installed and working")
-                    installed_count += 1
-                    verified_servers.append(server_name)
-                else:
-                    # Try to install
-                    if self._install_mcp_server(server_info, config):
-                        installed_count += 1
-                        verified_servers.append(server_name)
-                    else:
-                        failed_servers.append(server_name)
-
-                        # Check if this is a required server
-                        if server_info.get("required", False):
-                            self.logger.error(f"Required MCP server {server_name} failed to install")
-                            return False
+            if self._check_mcp_server_installed(server_name):
+                self.logger.info(f"MCP server {server_name} already installed and working")
+                results[server_name] = True
+            else:
+                pending_servers.append(server_name)
+
+        # Install the rest concurrently - every server is an independent,
+        # I/O-bound subprocess chain. Workers block in subprocess.run, which
+        # waits on the child's pipes via poll() rather than spinning, so the
+        # pool size is the only bound needed on threads even for the 15
+        # minute uv installs
+        if pending_servers:
+            # Multi-line API key notices are shown up front from this thread
+            # so they cannot interleave with output from the workers
+            for server_name in pending_servers:
+                self._show_api_key_notice(self.mcp_servers[server_name], config)
+
+            max_workers = min(8, len(pending_servers))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._install_mcp_server, self.mcp_servers[server_name], config, False): server_name
+                    for server_name in pending_servers
+                }
+                for future in as_completed(futures):
+                    server_name = futures[future]
+                    try:
+                        results[server_name] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error managing MCP server {server_name}: {e}")
+                        results[server_name] = False
+
+                    if not results[server_name] and self.mcp_servers[server_name].get("required", False):
+                        self.logger.error(f"Required MCP server {server_name} failed to install")
+                        # Drop installs that have not started; running ones finish on exit
+                        for pending in futures:
+                            pending.cancel()
+                        return False
+
+        # Collect results in the original order to keep output deterministic
+        for server_name in all_servers:
+            if results.get(server_name):
+                installed_count += 1
+                verified_servers.append(server_name)
             else:
-                self.logger.warning(f"Unknown MCP server '{server_name}' cannot be managed by SuperClaude")
+                failed_servers.append(server_name)
 
         # Update the list of successfully managed servers
         self.installed_servers_in_session = verified_servers
@@ -726,18 +916,15 @@ class MCPComponent(Component):
         if not config.get("dry_run", False):
             self.logger.info("Verifying MCP server installation...")
             try:
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "list"],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-
-                if result.returncode == 0:
-                    self.logger.debug("MCP servers list:")
-                    for line in result.stdout.strip().split('\n'):
-                        if line.strip():
-                            self.logger.debug(f"  {line.strip()}")
+                # Re-read the registered servers once; this also re-syncs the
+                # session and on-disk caches with the final CLI state
+                registered_servers = self._get_installed_servers(force=True)
+
+                if registered_servers is not None:
+                    # Log the raw listing, which includes each server's command
+                    # and health status, as a single record
+                    listing = textwrap.indent((self._installed_listing or "").strip(), "  ")
+                    self.logger.debug(f"MCP servers list:\n{listing}")
                 else:
                     self.logger.warning("Could not verify MCP server installation")
 
@@ -756,16 +943,17 @@ class MCPComponent(Component):
         """Post-installation tasks"""
         # Update metadata
         try:
-            metadata_mods = self.get_metadata_modifications()
-            self.settings_manager.update_metadata(metadata_mods)
+            with self.settings_manager.batch_metadata_updates():
+                metadata_mods = self.get_metadata_modifications()
+                self.settings_manager.update_metadata(metadata_mods)
 
-            # Add component registration to metadata
-            self.settings_manager.add_component_registration("mcp", {
-                "version": __version__,
-                "category": "integration",
-                "servers_count": len(self.installed_servers_in_session),
-                "installed_servers": self.installed_servers_in_session
-            })
+                # Add component registration to metadata
+                self.settings_manager.add_component_registration("mcp", {
+                    "version": __version__,
+                    "category": "integration",
+                    "servers_count": len(self.installed_servers_in_session),
+                    "installed_servers": self.installed_servers_in_session
+                })
 
             self.logger.info("Updated metadata with MCP component registration")
             return True
@@ -778,23 +966,38 @@ class MCPComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude MCP servers...")
             
-            # Uninstall each MCP server
+            # Uninstall each registered MCP server. One listing tells us which
+            # servers exist; 'claude mcp remove' accepts a single name and
+            # rewrites the Claude config, so removals run one at a time
             uninstalled_count = 0
+            try:
+                registered_servers = self._get_installed_servers()
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+                # Unknown state - try to remove every server we manage
+                self.logger.warning(f"Error checking MCP server status: {e}")
+                registered_servers = None
+            servers_to_remove = [
+                server_name for server_name in self.mcp_servers
+                if registered_servers is None or server_name in registered_servers
+            ]
             
-            for server_name in self.mcp_servers.keys():
+            for server_name in servers_to_remove:
                 if self._uninstall_mcp_server(server_name):
                     uninstalled_count += 1
             
+            try:
+                (self.install_dir / MCP_LIST_CACHE_FILE).unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning(f"Could not remove MCP server cache: {e}")
+
             # Update metadata to remove MCP component
             try:
-                if self.settings_manager.is_component_installed("mcp"):
-                    self.settings_manager.remove_component_registration("mcp")
-                    # Also remove MCP configuration from metadata
-                    metadata = self.settings_manager.load_metadata()
-                    if "mcp" in metadata:
-                        del metadata["mcp"]
-                        self.settings_manager.save_metadata(metadata)
-                    self.logger.info("Removed MCP component from metadata")
+                with self.settings_manager.batch_metadata_updates() as metadata:
+                    if self.settings_manager.is_component_installed("mcp"):
+                        self.settings_manager.remove_component_registration("mcp")
+                        # Also remove MCP configuration from metadata
+                        metadata.pop("mcp", None)
+                        self.logger.info("Removed MCP component from metadata")
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
@@ -827,8 +1030,25 @@ class MCPComponent(Component):
             # For MCP servers, update means reinstall to get latest versions
             updated_count = 0
             failed_servers = []
-            
-            for server_name, server_info in self.mcp_servers.items():
+
+            # List registered servers once; the per-server checks below are
+            # answered from this result
+            self._get_installed_servers(force=True)
+
+            # npm servers are registered as 'npx -y <package>', which resolves
+            # the package version at launch, so re-registering an existing one
+            # changes nothing. Only command-installed servers fetch new code.
+            needs_update = [
+                (server_name, server_info)
+                for server_name, server_info in self.mcp_servers.items()
+                if server_info.get("install_method") in _COMMAND_INSTALL_METHODS
+                or not self._check_mcp_server_installed(server_name)
+            ]
+            skipped = len(self.mcp_servers) - len(needs_update)
+            if skipped:
+                self.logger.info(f"{skipped} MCP server(s) resolve their version at launch, skipping reinstall")
+
+            for server_name, server_info in needs_update:
                 try:
                     # Uninstall old version
                     if self._check_mcp_server_installed(server_name):
@@ -847,13 +1067,12 @@ class MCPComponent(Component):
             # Update metadata
             try:
                 # Update component version in metadata
-                metadata = self.settings_manager.load_metadata()
-                if "components" in metadata and "mcp" in metadata["components"]:
-                    metadata["components"]["mcp"]["version"] = target_version
-                    metadata["components"]["mcp"]["servers_count"] = len(self.mcp_servers)
-                if "mcp" in metadata:
-                    metadata["mcp"]["servers"] = list(self.mcp_servers.keys())
-                self.settings_manager.save_metadata(metadata)
+                with self.settings_manager.batch_metadata_updates() as metadata:
+                    if "components" in metadata and "mcp" in metadata["components"]:
+                        metadata["components"]["mcp"]["version"] = target_version
+                        metadata["components"]["mcp"]["servers_count"] = len(self.mcp_servers)
+                    if "mcp" in metadata:
+                        metadata["mcp"]["servers"] = list(self.mcp_servers.keys())
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
@@ -873,35 +1092,30 @@ class MCPComponent(Component):
         errors = []
         
         # Check metadata registration
-        if not self.settings_manager.is_component_installed("mcp"):
+        component_info = self.settings_manager.get_component_info("mcp")
+        if component_info is None:
             errors.append("MCP component not registered in metadata")
             return False, errors
         
         # Check version matches
-        installed_version = self.settings_manager.get_component_version("mcp")
+        installed_version = component_info.get("version")
         expected_version = self.get_metadata()["version"]
         if installed_version != expected_version:
             errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
         # Check if Claude CLI is available and validate installed servers
         try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            # Always ask the CLI - this also checks that it responds
+            registered_servers = self._get_installed_servers(force=True)
 
-            if result.returncode != 0:
+            if registered_servers is None:
                 errors.append("Could not communicate with Claude CLI for MCP server verification")
             else:
-                claude_mcp_output = result.stdout.lower()
-
                 # Get the list of servers that should be installed from metadata
                 installed_servers = self.settings_manager.get_metadata_setting("mcp.servers", [])
 
                 for server_name in installed_servers:
-                    if server_name.lower() not in claude_mcp_output:
+                    if server_name.lower() not in registered_servers:
                         errors.append(f"Installed MCP server '{server_name}' not found in 'claude mcp list' output.")
 
         except Exception as e:
@@ -2,6 +2,11 @@
 MCP Documentation component for SuperClaude MCP server documentation
 """
 
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
@@ -9,6 +14,46 @@ from ..core.base import Component
 from setup import __version__
 from ..services.claude_md import CLAUDEMdService
 
+# MCP docs ship with the package in SuperClaude/SuperClaude/MCP/; this
+# module lives in SuperClaude/setup/components/
+_MCP_DOCS_DIR = Path(__file__).parent.parent.parent / "SuperClaude" / "MCP"
+_MCP_DOCS_DIR_EXISTS = _MCP_DOCS_DIR.is_dir()
+
+_METADATA = MappingProxyType({
+    "name": "mcp_docs",
+    "version": __version__,
+    "description": "MCP server documentation and usage guides",
+    "category": "documentation"
+})
+
+# Map server names to documentation files
+_SERVER_DOCS_MAP = MappingProxyType({
+    "context7": "MCP_Context7.md",
+    "sequential": "MCP_Sequential.md",
+    "sequential-thinking": "MCP_Sequential.md",  # Handle both naming conventions
+    "magic": "MCP_Magic.md",
+    "playwright": "MCP_Playwright.md",
+    "serena": "MCP_Serena.md",
+    "morphllm": "MCP_Morphllm.md",
+    "morphllm-fast-apply": "MCP_Morphllm.md",  # Handle both naming conventions
+    "tavily": "MCP_Tavily.md"
+})
+_DOC_FILES = frozenset(_SERVER_DOCS_MAP.values())
+
+# Map common server name variations to our _SERVER_DOCS_MAP keys
+_SERVER_NAME_MAPPINGS = MappingProxyType({
+    "context7": "context7",
+    "sequential-thinking": "sequential-thinking",
+    "sequential": "sequential-thinking",
+    "magic": "magic",
+    "playwright": "playwright",
+    "serena": "serena",
+    "morphllm": "morphllm",
+    "morphllm-fast-apply": "morphllm",
+    "morph": "morphllm",
+    "tavily": "tavily"
+})
+
 
 class MCPDocsComponent(Component):
     """MCP documentation component - installs docs for selected MCP servers"""
@@ -18,30 +63,15 @@ class MCPDocsComponent(Component):
         # Initialize attributes before calling parent constructor
         # because parent calls _discover_component_files() which needs these
         self.selected_servers: List[str] = []
+        self._config_detection: Optional[Tuple[Tuple[Path, float], List[str]]] = None
         
-        # Map server names to documentation files
-        self.server_docs_map = {
-            "context7": "MCP_Context7.md",
-            "sequential": "MCP_Sequential.md",
-            "sequential-thinking": "MCP_Sequential.md",  # Handle both naming conventions
-            "magic": "MCP_Magic.md",
-            "playwright": "MCP_Playwright.md",
-            "serena": "MCP_Serena.md",
-            "morphllm": "MCP_Morphllm.md",
-            "morphllm-fast-apply": "MCP_Morphllm.md",  # Handle both naming conventions
-            "tavily": "MCP_Tavily.md"
-        }
+        self.server_docs_map = _SERVER_DOCS_MAP
         
         super().__init__(install_dir, Path(""))
     
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
-        return {
-            "name": "mcp_docs",
-            "version": __version__,
-            "description": "MCP server documentation and usage guides",
-            "category": "documentation"
-        }
+        return dict(_METADATA)
 
     def is_reinstallable(self) -> bool:
         """
@@ -66,13 +96,15 @@ class MCPDocsComponent(Component):
         files = []
 
         if source_dir and self.selected_servers:
+            # List the source directory once instead of checking each doc file
+            with os.scandir(source_dir) as entries:
+                available = {entry.name for entry in entries if entry.is_file()}
+
             for server_name in self.selected_servers:
                 if server_name in self.server_docs_map:
                     doc_file = self.server_docs_map[server_name]
-                    source = source_dir / doc_file
-                    target = self.install_dir / doc_file
-                    if source.exists():
-                        files.append((source, target))
+                    if doc_file in available:
+                        files.append((source_dir / doc_file, self.install_dir / doc_file))
                         self.logger.debug(f"Will install documentation for {server_name}: {doc_file}")
                     else:
                         self.logger.warning(f"Documentation file not found for {server_name}: {doc_file}")
@@ -91,42 +123,55 @@ class MCPDocsComponent(Component):
                     files.append(self.server_docs_map[server_name])
         return files
     
+    def _find_claude_config(self) -> Optional[Tuple[Path, float]]:
+        """Find the Claude Desktop/CLI config file and its modification time"""
+        config_paths = [
+            self.install_dir / "claude_desktop_config.json",
+            Path.home() / ".claude" / "claude_desktop_config.json",
+            Path.home() / ".claude.json",  # Claude CLI config
+            Path.home() / "AppData" / "Roaming" / "Claude" / "claude_desktop_config.json",  # Windows
+            Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",  # macOS
+        ]
+
+        for path in config_paths:
+            try:
+                return path, path.stat().st_mtime
+            except OSError:
+                continue
+
+        return None
+
     def _detect_existing_mcp_servers_from_config(self) -> List[str]:
         """Detect existing MCP servers from Claude Desktop config"""
         detected_servers = []
 
         try:
             # Try to find Claude Desktop config file
-            config_paths = [
-                self.install_dir / "claude_desktop_config.json",
-                Path.home() / ".claude" / "claude_desktop_config.json",
-                Path.home() / ".claude.json",  # Claude CLI config
-                Path.home() / "AppData" / "Roaming" / "Claude" / "claude_desktop_config.json",  # Windows
-                Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",  # macOS
-            ]
-
-            config_file = None
-            for path in config_paths:
-                if path.exists():
-                    config_file = path
-                    break
-
-            if not config_file:
+            found = self._find_claude_config()
+            if not found:
                 self.logger.debug("No Claude Desktop config file found")
                 return detected_servers
 
-            import json
+            # Reuse the previous result while the config file is unchanged
+            if self._config_detection and self._config_detection[0] == found:
+                return list(self._config_detection[1])
+
+            config_file = found[0]
             with open(config_file, 'r') as f:
                 config = json.load(f)
 
-            # Extract MCP server names from mcpServers section
-            mcp_servers = config.get("mcpServers", {})
-            for server_name in mcp_servers.keys():
+            # Only the server names are needed - drop the rest of the config
+            server_names = list(config.get("mcpServers", {}))
+            del config
+
+            for server_name in server_names:
                 # Map common name variations to our doc file names
                 normalized_name = self._normalize_server_name(server_name)
                 if normalized_name and normalized_name in self.server_docs_map:
                     detected_servers.append(normalized_name)
 
+            self._config_detection = (found, list(detected_servers))
+
             if detected_servers:
                 self.logger.info(f"Detected existing MCP servers from config: {detected_servers}")
 
@@ -140,22 +185,11 @@ class MCPDocsComponent(Component):
         if not server_name:
             return None
 
-        server_name = server_name.lower().strip()
-
-        # Map common variations to our server_docs_map keys
-        name_mappings = {
-            "context7": "context7",
-            "sequential-thinking": "sequential-thinking",
-            "sequential": "sequential-thinking",
-            "magic": "magic",
-            "playwright": "playwright",
-            "serena": "serena",
-            "morphllm": "morphllm",
-            "morphllm-fast-apply": "morphllm",
-            "morph": "morphllm"
-        }
-
-        return name_mappings.get(server_name)
+        # Config keys usually match a mapping entry exactly
+        normalized = _SERVER_NAME_MAPPINGS.get(server_name)
+        if normalized is not None:
+            return normalized
+        return _SERVER_NAME_MAPPINGS.get(server_name.strip().lower())
 
     def _install(self, config: Dict[str, Any]) -> bool:
         """Install MCP documentation component with auto-detection"""
@@ -171,8 +205,8 @@ class MCPDocsComponent(Component):
         # Get previously documented servers from metadata
         previous_servers = self.settings_manager.get_metadata_setting("components.mcp_docs.servers_documented", [])
 
-        # Merge all server lists
-        all_servers = list(set(detected_servers + selected_servers + previous_servers))
+        # Merge all server lists, dropping duplicates but keeping order
+        all_servers = dict.fromkeys(chain(detected_servers, selected_servers, previous_servers))
 
         # Filter to only servers we have documentation for
         valid_servers = [s for s in all_servers if s in self.server_docs_map]
@@ -192,9 +226,10 @@ class MCPDocsComponent(Component):
         if previous_servers:
             self.logger.info(f"  - Previously documented: {previous_servers}")
 
-        # Set the servers for which we'll install documentation
+        # Set the servers for which we'll install documentation; every valid
+        # server has a doc file, so the expected files map straight across
         self.set_selected_servers(valid_servers)
-        self.component_files = self._discover_component_files()
+        self.component_files = [self.server_docs_map[s] for s in valid_servers]
 
         # Validate installation
         success, errors = self.validate_prerequisites()
@@ -210,14 +245,22 @@ class MCPDocsComponent(Component):
             self.logger.warning("No MCP documentation files found to install")
             return False
 
-        # Copy documentation files
+        # Copy documentation files; the copies are independent, so overlap them
         success_count = 0
         successfully_copied_files = []
 
-        for source, target in files_to_install:
+        def copy_doc(paths: Tuple[Path, Path]) -> bool:
+            source, target = paths
             self.logger.debug(f"Copying {source.name} to {target}")
+            return self.file_manager.copy_file(source, target)
 
-            if self.file_manager.copy_file(source, target):
+        # Server name aliases can share a doc file - copy each target only once
+        unique_files = list(dict.fromkeys(files_to_install))
+        with ThreadPoolExecutor(max_workers=min(4, len(unique_files))) as executor:
+            copy_results = dict(zip(unique_files, executor.map(copy_doc, unique_files)))
+
+        for source, target in files_to_install:
+            if copy_results[(source, target)]:
                 success_count += 1
                 successfully_copied_files.append(source.name)
                 self.logger.debug(f"Successfully copied {source.name}")
@@ -273,10 +316,20 @@ class MCPDocsComponent(Component):
             # Remove all MCP documentation files
             removed_count = 0
             source_dir = self._get_source_dir()
+
+            # Scan the install directory once for doc files that are present
+            entry_count = 0
+            present_docs = []
+            subdir_exists = self.install_component_subdir.is_dir()
+            if subdir_exists:
+                with os.scandir(self.install_component_subdir) as entries:
+                    for entry in entries:
+                        entry_count += 1
+                        if entry.name in _DOC_FILES:
+                            present_docs.append(entry.name)
             
-            if source_dir and source_dir.exists():
-                # Remove all possible MCP doc files
-                for doc_file in self.server_docs_map.values():
+            if source_dir:
+                for doc_file in sorted(present_docs):
                     file_path = self.install_component_subdir / doc_file
                     if self.file_manager.remove_file(file_path):
                         removed_count += 1
@@ -284,11 +337,9 @@ class MCPDocsComponent(Component):
             
             # Remove mcp directory if empty
             try:
-                if self.install_component_subdir.exists():
-                    remaining_files = list(self.install_component_subdir.iterdir())
-                    if not remaining_files:
-                        self.install_component_subdir.rmdir()
-                        self.logger.debug("Removed empty mcp directory")
+                if subdir_exists and entry_count == removed_count:
+                    self.install_component_subdir.rmdir()
+                    self.logger.debug("Removed empty mcp directory")
             except Exception as e:
                 self.logger.warning(f"Could not remove mcp directory: {e}")
             
@@ -313,29 +364,22 @@ class MCPDocsComponent(Component):
     
     def _get_source_dir(self) -> Optional[Path]:
         """Get source directory for MCP documentation files"""
-        # Assume we're in SuperClaude/setup/components/mcp_docs.py
-        # and MCP docs are in SuperClaude/SuperClaude/MCP/
-        project_root = Path(__file__).parent.parent.parent
-        mcp_dir = project_root / "SuperClaude" / "MCP"
-        
         # Return None if directory doesn't exist to prevent warning
-        if not mcp_dir.exists():
-            return None
-        
-        return mcp_dir
+        return _MCP_DOCS_DIR if _MCP_DOCS_DIR_EXISTS else None
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
         source_dir = self._get_source_dir()
         total_size = 0
         
-        if source_dir and source_dir.exists() and self.selected_servers:
-            for server_name in self.selected_servers:
-                if server_name in self.server_docs_map:
-                    doc_file = self.server_docs_map[server_name]
-                    file_path = source_dir / doc_file
-                    if file_path.exists():
-                        total_size += file_path.stat().st_size
+        if source_dir and self.selected_servers:
+            # Size the docs from one directory scan; aliases sharing a doc
+            # file are only counted once
+            doc_files = {self.server_docs_map[s] for s in self.selected_servers if s in self.server_docs_map}
+            with os.scandir(source_dir) as entries:
+                for entry in entries:
+                    if entry.name in doc_files and entry.is_file():
+                        total_size += entry.stat().st_size
         
         # Minimum size estimate
         total_size = max(total_size, 10240)  # At least 10KB
@@ -36,10 +36,10 @@ class FileService:
         Returns:
             True if successful, False otherwise
         """
-        if not source.exists():
-            raise FileNotFoundError(f"Source file not found: {source}")
-        
+        # One stat on the common path; only tell the two errors apart on failure
         if not source.is_file():
+            if not source.exists():
+                raise FileNotFoundError(f"Source file not found: {source}")
             raise ValueError(f"Source is not a file: {source}")
         
         if self.dry_run:
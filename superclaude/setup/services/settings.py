@@ -5,8 +5,10 @@ Allows for manipulation of these json files with deep merge and backup
 """
 
 import json
+import os
 import shutil
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Iterator
 from pathlib import Path
 from datetime import datetime
 import copy
@@ -26,6 +28,7 @@ class SettingsService:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self._metadata_batch: Optional[Dict[str, Any]] = None
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -72,6 +75,9 @@ class SettingsService:
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
+        if self._metadata_batch is not None:
+            return self._metadata_batch
+
         if not self.metadata_file.exists():
             return {}
         
@@ -88,16 +94,60 @@ class SettingsService:
         Args:
             metadata: Metadata dict to save
         """
+        # Inside a batch, keep the changes in memory until the batch ends
+        if self._metadata_batch is not None:
+            if metadata is not self._metadata_batch:
+                self._metadata_batch.clear()
+                self._metadata_batch.update(metadata)
+            return
+
         # Ensure directory exists
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save with pretty formatting
+        # Save with pretty formatting; write a temp file and swap it in so an
+        # interrupted save never leaves a truncated metadata file behind
+        temp_file = self.metadata_file.with_name(self.metadata_file.name + ".tmp")
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
+            os.replace(temp_file, self.metadata_file)
         except IOError as e:
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
             raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
 
+    @contextmanager
+    def batch_metadata_updates(self) -> Iterator[Dict[str, Any]]:
+        """
+        Group several metadata changes into a single load and save
+
+        Within the block, load_metadata() returns one shared in-memory dict and
+        save_metadata() only updates it; the file is written once on exit, and
+        only if the metadata changed. Nothing is written if the block raises.
+
+        Yields:
+            The in-memory metadata dict
+        """
+        if self._metadata_batch is not None:
+            # Nested batch - the outermost one saves
+            yield self._metadata_batch
+            return
+
+        self._metadata_batch = self.load_metadata()
+        original = copy.deepcopy(self._metadata_batch)
+        try:
+            yield self._metadata_batch
+            metadata = self._metadata_batch
+        finally:
+            self._metadata_batch = None
+
+        # Callers may mutate the yielded dict directly, so compare contents
+        # rather than tracking save_metadata() calls
+        if metadata != original:
+            self.save_metadata(metadata)
+
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge modifications into existing settings
@@ -317,6 +367,18 @@ class SettingsService:
         components = self.get_installed_components()
         return component_name in components
     
+    def get_component_info(self, component_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the registry entry of an installed component
+        
+        Args:
+            component_name: Name of component
+            
+        Returns:
+            Component info dict or None if not installed
+        """
+        return self.get_installed_components().get(component_name)
+    
     def get_component_version(self, component_name: str) -> Optional[str]:
         """
         Get installed version of component
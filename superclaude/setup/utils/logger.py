@@ -69,6 +69,10 @@ class Logger:
         # Custom formatter with colors
         class ColorFormatter(logging.Formatter):
             def format(self, record):
+                # Records logged through Logger.success()
+                if getattr(record, 'success', False):
+                    return f"{Colors.GREEN}[{symbols.checkmark}] {record.getMessage()}{Colors.RESET}"
+
                 # Color mapping
                 colors = {
                     'DEBUG': Colors.WHITE,
@@ -172,22 +176,11 @@ class Logger:
     
     def success(self, message: str, **kwargs) -> None:
         """Log success message (info level with special formatting)"""
-        # Use a custom success formatter for console
-        if self.logger.handlers:
-            console_handler = self.logger.handlers[0]
-            if hasattr(console_handler, 'formatter'):
-                original_format = console_handler.formatter.format
-                
-                def success_format(record):
-                    return f"{Colors.GREEN}[{symbols.checkmark}] {record.getMessage()}{Colors.RESET}"
-                
-                console_handler.formatter.format = success_format
-                self.logger.info(message, **kwargs)
-                console_handler.formatter.format = original_format
-            else:
-                self.logger.info(f"SUCCESS: {message}", **kwargs)
-        else:
-            self.logger.info(f"SUCCESS: {message}", **kwargs)
+        # Flag the record for the console formatter rather than swapping the
+        # shared formatter, which raced with concurrent log calls
+        extra = dict(kwargs.pop('extra', None) or {})
+        extra['success'] = True
+        self.logger.info(message, extra=extra, **kwargs)
         
         self.log_counts['info'] += 1
     
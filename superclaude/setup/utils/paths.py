@@ -4,9 +4,11 @@ Handles cross-platform path operations and immutable distro support
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_home_directory() -> Path:
     """
     Get the correct home directory path, handling immutable distros.
@@ -14,6 +16,8 @@ def get_home_directory() -> Path:
     On immutable distros like Fedora Silverblue/Universal Blue,
     the home directory is at /var/home/$USER instead of /home/$USER.
     This function properly detects the actual home directory.
+    The result is cached for the lifetime of the process; call
+    get_home_directory.cache_clear() to force re-detection.
 
     Returns:
         Path: The actual home directory path
@@ -22,7 +26,7 @@ def get_home_directory() -> Path:
     try:
         home = Path.home()
         # Verify the path actually exists and is accessible
-        if home.exists() and home.is_dir():
+        if home.is_dir():
             return home
     except Exception:
         pass
@@ -33,7 +37,7 @@ def get_home_directory() -> Path:
     home_env = os.environ.get('HOME')
     if home_env:
         home_path = Path(home_env)
-        if home_path.exists() and home_path.is_dir():
+        if home_path.is_dir():
             return home_path
 
     # Method 2: Check for immutable distro patterns
@@ -46,7 +50,7 @@ def get_home_directory() -> Path:
         ]
 
         for path in immutable_paths:
-            if path.exists() and path.is_dir():
+            if path.is_dir():
                 return path
 
     # Method 3: Last resort - use the original Path.home() even if it seems wrong
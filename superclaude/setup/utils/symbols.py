@@ -3,118 +3,157 @@ Windows-compatible symbol fallbacks for SuperClaude UI
 Handles Unicode encoding issues on Windows terminals
 """
 
+import codecs
 import sys
 import os
-import platform
-
-
+from functools import lru_cache
+from types import SimpleNamespace
+
+
+# ASCII stand-ins for the Unicode symbols used in the UI
+_FALLBACK_TABLE = str.maketrans({
+    "✓": "+",
+    "✗": "x",
+    "█": "#",
+    "░": "-",
+    "═": "=",
+    "⠋": "|",
+    "⠙": "/",
+    "⠹": "-",
+    "⠸": "\\",
+    "⠼": "|",
+    "⠴": "/",
+    "⠦": "-",
+    "⠧": "\\",
+    "⠇": "|",
+    "⠏": "/",
+    "╔": "+",
+    "╗": "+",
+    "╚": "+",
+    "╝": "+",
+    "║": "|",
+})
+_FALLBACK_CHARS = frozenset(map(chr, _FALLBACK_TABLE))
+
+# Canonical codecs.lookup() names of encodings that cover every symbol
+# (cp65001 resolves to utf-8)
+_UNICODE_CODECS = frozenset({
+    "utf-8", "utf-8-sig",
+    "utf-16", "utf-16-le", "utf-16-be",
+    "utf-32", "utf-32-le", "utf-32-be",
+})
+
+
+@lru_cache(maxsize=1)
 def can_display_unicode() -> bool:
     """
     Detect if terminal can display Unicode symbols safely
 
+    The result is cached for the lifetime of the process. The module-level
+    symbols are chosen from it once at import, so clearing the cache later
+    does not change them.
+
     Returns:
         True if Unicode is safe to use, False if fallbacks needed
     """
+    encoding = getattr(sys.stdout, 'encoding', None)
+
     # Check if we're on Windows with problematic encoding
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
         # Check console encoding
         try:
-            # Test if we can encode common Unicode symbols
-            test_symbols = "✓✗█░⠋═"
-            test_symbols.encode(sys.stdout.encoding or 'cp1252')
+            codec = codecs.lookup(encoding or 'cp1252').name
+        except LookupError:
+            return False
+        if codec in _UNICODE_CODECS:
             return True
-        except (UnicodeEncodeError, LookupError):
+
+        # Legacy code page - test if we can encode common Unicode symbols
+        try:
+            "✓✗█░⠋═".encode(codec)
+            return True
+        except UnicodeEncodeError:
             return False
 
     # Check if stdout encoding supports Unicode
-    encoding = getattr(sys.stdout, 'encoding', None)
-    if encoding and encoding.lower() in ['utf-8', 'utf8']:
-        return True
+    if encoding:
+        try:
+            return codecs.lookup(encoding).name in _UNICODE_CODECS
+        except LookupError:
+            pass
 
     # Conservative fallback for unknown systems
     return False
 
 
-class Symbols:
-    """Cross-platform symbol definitions with Windows fallbacks"""
-
-    def __init__(self):
-        self.unicode_safe = can_display_unicode()
-
-    @property
-    def checkmark(self) -> str:
-        """Success checkmark symbol"""
-        return "✓" if self.unicode_safe else "+"
-
-    @property
-    def crossmark(self) -> str:
-        """Error/failure cross symbol"""
-        return "✗" if self.unicode_safe else "x"
-
-    @property
-    def block_filled(self) -> str:
-        """Filled block for progress bars"""
-        return "█" if self.unicode_safe else "#"
-
-    @property
-    def block_empty(self) -> str:
-        """Empty block for progress bars"""
-        return "░" if self.unicode_safe else "-"
-
-    @property
-    def double_line(self) -> str:
-        """Double line separator"""
-        return "═" if self.unicode_safe else "="
-
-    @property
-    def spinner_chars(self) -> str:
-        """Spinner animation characters"""
-        if self.unicode_safe:
-            return "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-        else:
-            return "|/-\\|/-\\"
-
-    @property
-    def box_top_left(self) -> str:
-        """Box drawing: top-left corner"""
-        return "╔" if self.unicode_safe else "+"
-
-    @property
-    def box_top_right(self) -> str:
-        """Box drawing: top-right corner"""
-        return "╗" if self.unicode_safe else "+"
-
-    @property
-    def box_bottom_left(self) -> str:
-        """Box drawing: bottom-left corner"""
-        return "╚" if self.unicode_safe else "+"
-
-    @property
-    def box_bottom_right(self) -> str:
-        """Box drawing: bottom-right corner"""
-        return "╝" if self.unicode_safe else "+"
-
-    @property
-    def box_horizontal(self) -> str:
-        """Box drawing: horizontal line"""
-        return "═" if self.unicode_safe else "="
-
-    @property
-    def box_vertical(self) -> str:
-        """Box drawing: vertical line"""
-        return "║" if self.unicode_safe else "|"
-
-    def make_separator(self, length: int) -> str:
-        """Create a separator line of specified length"""
-        return self.double_line * length
-
-    def make_box_line(self, length: int) -> str:
-        """Create a box horizontal line of specified length"""
-        return self.box_horizontal * length
-
-
-# Global instance for easy import
-symbols = Symbols()
+# Terminal Unicode support is fixed for the process, so every symbol is
+# chosen once at import
+UNICODE_SAFE = can_display_unicode()
+
+# Status marks
+CHECKMARK = "✓" if UNICODE_SAFE else "+"
+CROSSMARK = "✗" if UNICODE_SAFE else "x"
+
+# Progress bars, separators and spinner
+BLOCK_FILLED = "█" if UNICODE_SAFE else "#"
+BLOCK_EMPTY = "░" if UNICODE_SAFE else "-"
+DOUBLE_LINE = "═" if UNICODE_SAFE else "="
+SPINNER_CHARS = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏" if UNICODE_SAFE else "|/-\\|/-\\"
+
+# Box drawing
+BOX_TOP_LEFT = "╔" if UNICODE_SAFE else "+"
+BOX_TOP_RIGHT = "╗" if UNICODE_SAFE else "+"
+BOX_BOTTOM_LEFT = "╚" if UNICODE_SAFE else "+"
+BOX_BOTTOM_RIGHT = "╝" if UNICODE_SAFE else "+"
+BOX_HORIZONTAL = "═" if UNICODE_SAFE else "="
+BOX_VERTICAL = "║" if UNICODE_SAFE else "|"
+
+
+# UI code redraws the same few widths over and over, so the lines are cached
+@lru_cache(maxsize=128)
+def make_separator(length: int) -> str:
+    """Create a separator line of specified length"""
+    return DOUBLE_LINE * length
+
+
+@lru_cache(maxsize=128)
+def make_box_line(length: int) -> str:
+    """Create a box horizontal line of specified length"""
+    return BOX_HORIZONTAL * length
+
+
+@lru_cache(maxsize=64)
+def make_box_top(length: int) -> str:
+    """Create a box top edge with corners around a line of specified length"""
+    return BOX_TOP_LEFT + BOX_HORIZONTAL * length + BOX_TOP_RIGHT
+
+
+@lru_cache(maxsize=64)
+def make_box_bottom(length: int) -> str:
+    """Create a box bottom edge with corners around a line of specified length"""
+    return BOX_BOTTOM_LEFT + BOX_HORIZONTAL * length + BOX_BOTTOM_RIGHT
+
+
+# Global namespace for easy import (symbols.checkmark, symbols.make_separator(...))
+symbols = SimpleNamespace(
+    unicode_safe=UNICODE_SAFE,
+    checkmark=CHECKMARK,
+    crossmark=CROSSMARK,
+    block_filled=BLOCK_FILLED,
+    block_empty=BLOCK_EMPTY,
+    double_line=DOUBLE_LINE,
+    spinner_chars=SPINNER_CHARS,
+    box_top_left=BOX_TOP_LEFT,
+    box_top_right=BOX_TOP_RIGHT,
+    box_bottom_left=BOX_BOTTOM_LEFT,
+    box_bottom_right=BOX_BOTTOM_RIGHT,
+    box_horizontal=BOX_HORIZONTAL,
+    box_vertical=BOX_VERTICAL,
+    make_separator=make_separator,
+    make_box_line=make_box_line,
+    make_box_top=make_box_top,
+    make_box_bottom=make_box_bottom,
+)
 
 
 def safe_print(*args, **kwargs):
@@ -126,48 +165,24 @@ def safe_print(*args, **kwargs):
     try:
         print(*args, **kwargs)
     except UnicodeEncodeError:
-        # Convert arguments to safe strings
+        # Convert arguments to safe strings in one pass, replacing
+        # problematic Unicode characters where there are any
         safe_args = []
         for arg in args:
-            if isinstance(arg, str):
-                # Replace problematic Unicode characters
-                safe_arg = (arg
-                    .replace("✓", "+")
-                    .replace("✗", "x")
-                    .replace("█", "#")
-                    .replace("░", "-")
-                    .replace("═", "=")
-                    .replace("⠋", "|")
-                    .replace("⠙", "/")
-                    .replace("⠹", "-")
-                    .replace("⠸", "\\")
-                    .replace("⠼", "|")
-                    .replace("⠴", "/")
-                    .replace("⠦", "-")
-                    .replace("⠧", "\\")
-                    .replace("⠇", "|")
-                    .replace("⠏", "/")
-                    .replace("╔", "+")
-                    .replace("╗", "+")
-                    .replace("╚", "+")
-                    .replace("╝", "+")
-                    .replace("║", "|")
-                )
-                safe_args.append(safe_arg)
-            else:
-                safe_args.append(str(arg))
+            text = arg if type(arg) is str else str(arg)
+            if not _FALLBACK_CHARS.isdisjoint(text):
+                text = text.translate(_FALLBACK_TABLE)
+            safe_args.append(text)
 
         # Try printing with safe arguments
         try:
             print(*safe_args, **kwargs)
         except UnicodeEncodeError:
-            # Last resort: encode to ASCII with replacement
-            final_args = []
-            for arg in safe_args:
-                if isinstance(arg, str):
-                    final_args.append(arg.encode('ascii', 'replace').decode('ascii'))
-                else:
-                    final_args.append(str(arg))
+            # Last resort: encode to the stream's own encoding with
+            # replacement, keeping every character it can represent
+            stream = kwargs.get('file') or sys.stdout
+            encoding = getattr(stream, 'encoding', None) or 'ascii'
+            final_args = [arg.encode(encoding, 'replace').decode(encoding) for arg in safe_args]
             print(*final_args, **kwargs)
 
 
@@ -175,24 +190,9 @@ def format_with_symbols(text: str) -> str:
     """
     Replace Unicode symbols in text with Windows-compatible alternatives
     """
-    if symbols.unicode_safe:
+    # Most text has no symbols at all - return it without building a copy
+    if UNICODE_SAFE or _FALLBACK_CHARS.isdisjoint(text):
         return text
 
     # Replace symbols with safe alternatives
-    replacements = {
-        "✓": symbols.checkmark,
-        "✗": symbols.crossmark,
-        "█": symbols.block_filled,
-        "░": symbols.block_empty,
-        "═": symbols.double_line,
-        "╔": symbols.box_top_left,
-        "╗": symbols.box_top_right,
-        "╚": symbols.box_bottom_left,
-        "╝": symbols.box_bottom_right,
-        "║": symbols.box_vertical,
-    }
-
-    for unicode_char, safe_char in replacements.items():
-        text = text.replace(unicode_char, safe_char)
-
-    return text
\ No newline at end of file
+    return text.translate(_FALLBACK_TABLE)